@@ -175,8 +175,8 @@ def run_draft(
 
     # 4. Save Artifact JSON
     json_path = output_dir / "artifact.json"
-    with open(json_path, "w") as f:
-        f.write(artifact.model_dump_json(indent=2))
+    # Raw UTF-8 bytes, independent of the platform's default text encoding and newline translation
+    json_path.write_bytes(artifact.model_dump_json(indent=2).encode())
     logger.info(f"Draft artifact saved to {json_path}")
 
     # 5. Generate PDF
@@ -209,11 +209,8 @@ def run_diff(current_path: Path, previous_path: Path) -> None:
     logger.info("Running semantic check...")
 
     try:
-        with open(current_path, "r") as f:
-            current = DraftArtifact.model_validate_json(f.read())
-
-        with open(previous_path, "r") as f:
-            previous = DraftArtifact.model_validate_json(f.read())
+        current = DraftArtifact.model_validate_json(current_path.read_bytes())
+        previous = DraftArtifact.model_validate_json(previous_path.read_bytes())
 
     except Exception as e:
         raise ScribeError(f"Failed to load artifacts: {e}") from e
@@ -8,14 +8,14 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-import json
+import io
 import math
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import IO, Dict, Final, List, Set
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from coreason_scribe.models import (
     AssayReport,
@@ -26,6 +26,33 @@ from coreason_scribe.models import (
     RiskLevel,
 )
 
+# libyaml's C loader accepts the same safe subset as yaml.SafeLoader, but parses several times faster.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Validates a whole requirements list in one pydantic-core call; the validator is built once at import.
+_REQUIREMENTS_ADAPTER: Final[TypeAdapter[List[Requirement]]] = TypeAdapter(List[Requirement])
+
+# Style definitions shared by every Mermaid diagram, joined once at import.
+_CLASSDEFS: Final[str] = "\n".join(
+    (
+        "classDef pass fill:#e6fffa,stroke:#00cc99,stroke-width:2px;",
+        "classDef warning fill:#fff4e6,stroke:#ff9900,stroke-width:2px;",
+        "classDef criticalGap fill:#ffcccc,stroke:#ff0000,stroke-width:2px;",
+        "classDef fail fill:#ffcccc,stroke:#ff0000,stroke-width:2px;",
+        "classDef code fill:#e6f7ff,stroke:#1890ff,stroke-width:1px;",
+        "classDef default fill:#ffffff,stroke:#000000;",
+    )
+)
+
+# A diagram with no nodes is just the header, so it is rendered once at import.
+_EMPTY_DIAGRAM: Final[str] = f"graph TD\n{_CLASSDEFS}"
+
+# Characters that would break a quoted Mermaid label, mapped to safe stand-ins in one translate pass.
+_LABEL_ESCAPES: Final[Dict[int, str]] = str.maketrans({'"': "'", "\n": " ", "\r": " "})
+
 
 class ComplianceStatus(str, Enum):
     """
@@ -37,6 +64,14 @@ class ComplianceStatus(str, Enum):
     CRITICAL_GAP = "CRITICAL_GAP"
 
 
+# Mermaid classDef applied to a requirement node for each compliance status.
+_STATUS_STYLES: Final[Dict[ComplianceStatus, str]] = {
+    ComplianceStatus.PASS: "pass",
+    ComplianceStatus.WARNING: "warning",
+    ComplianceStatus.CRITICAL_GAP: "criticalGap",
+}
+
+
 class GapAnalysisResult(BaseModel):
     """
     Result of a gap analysis for a single requirement.
@@ -122,9 +157,7 @@ class ComplianceEngine:
         mapping: Dict[str, List[AssayResult]] = {}
         for result in assay_report.results:
             for req_id in result.linked_requirements:
-                if req_id not in mapping:
-                    mapping[req_id] = []
-                mapping[req_id].append(result)
+                mapping.setdefault(req_id, []).append(result)
         return mapping
 
     @staticmethod
@@ -137,6 +170,23 @@ class ComplianceEngine:
             return 0.0
         return max(r.coverage for r in linked_results)
 
+    @staticmethod
+    def calculate_max_coverage(assay_report: AssayReport) -> Dict[str, float]:
+        """
+        Maps Requirement IDs to their aggregate coverage in a single pass over the report.
+        Strategy: Max Coverage. Requirements with no positive coverage (no linked results, or only 0.0)
+        are absent and read as 0.0.
+        """
+        max_coverage: Dict[str, float] = {}
+        # Bind the lookup once and read each result's coverage once; this loop is the hot path for large reports.
+        current = max_coverage.get
+        for result in assay_report.results:
+            coverage = result.coverage
+            for req_id in result.linked_requirements:
+                if coverage > current(req_id, 0.0):
+                    max_coverage[req_id] = coverage
+        return max_coverage
+
     def evaluate_compliance(
         self, requirements: List[Requirement], assay_report: AssayReport
     ) -> Dict[str, ComplianceStatus]:
@@ -146,12 +196,11 @@ class ComplianceEngine:
         Returns:
             A dictionary mapping Requirement ID to ComplianceStatus.
         """
-        req_to_tests = self.map_requirements_to_tests(assay_report)
+        max_coverage = self.calculate_max_coverage(assay_report)
         statuses: Dict[str, ComplianceStatus] = {}
 
         for req in requirements:
-            linked_tests = req_to_tests.get(req.id, [])
-            coverage = self.calculate_requirement_coverage(linked_tests)
+            coverage = max_coverage.get(req.id, 0.0)
             result = RiskAnalyzer.analyze_coverage(req, coverage)
             statuses[req.id] = result.status
 
@@ -183,24 +232,35 @@ class TraceabilityMatrixBuilder:
         if not yaml_path.exists():
             raise FileNotFoundError(f"Requirements file not found: {yaml_path}")
 
+        with open(yaml_path, "rb") as f:
+            return self.load_requirements_stream(f)
+
+    def load_requirements_stream(self, stream: IO[bytes]) -> List[Requirement]:
+        """
+        Loads requirements from an open binary stream, such as an uploaded agent.yaml.
+
+        Args:
+            stream: A readable binary stream containing the YAML document.
+
+        Returns:
+            A list of Requirement objects.
+
+        Raises:
+            ValueError: If the content is invalid or does not match schema.
+        """
         try:
-            with open(yaml_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(stream, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Failed to parse YAML: {e}") from e
 
         if not isinstance(data, list):
             raise ValueError("Requirements file must contain a list of requirements")
 
-        requirements = []
         try:
-            for item in data:
-                requirements.append(Requirement(**item))
+            return _REQUIREMENTS_ADAPTER.validate_python(data)
         except ValidationError as e:
             raise ValueError(f"Invalid requirement schema: {e}") from e
 
-        return requirements
-
     def load_assay_report(self, json_path: Path) -> AssayReport:
         """
         Loads the assay report from a JSON file.
@@ -218,19 +278,31 @@ class TraceabilityMatrixBuilder:
         if not json_path.exists():
             raise FileNotFoundError(f"Assay report file not found: {json_path}")
 
-        try:
-            with open(json_path, "r") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON: {e}") from e
+        with open(json_path, "rb") as f:
+            return self.load_assay_report_stream(f)
+
+    def load_assay_report_stream(self, stream: IO[bytes]) -> AssayReport:
+        """
+        Loads the assay report from an open binary stream, such as an uploaded assay_report.json.
+
+        Args:
+            stream: A readable binary stream containing the JSON document.
 
+        Returns:
+            An AssayReport object.
+
+        Raises:
+            ValueError: If the content is invalid or does not match schema.
+        """
+        # pydantic-core parses and validates the raw bytes in one pass; malformed JSON
+        # surfaces as a "json_invalid" validation error rather than a JSONDecodeError.
         try:
-            report = AssayReport(**data)
+            return AssayReport.model_validate_json(stream.read())
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise ValueError(f"Failed to parse JSON: {e}") from e
             raise ValueError(f"Invalid assay report schema: {e}") from e
 
-        return report
-
     def generate_mermaid_diagram(
         self, requirements: List[Requirement], assay_report: AssayReport, draft_artifact: DraftArtifact
     ) -> str:
@@ -245,19 +317,18 @@ class TraceabilityMatrixBuilder:
         Returns:
             A string containing the Mermaid diagram definition.
         """
-        lines = ["graph TD"]
+        if not requirements and not assay_report.results and not draft_artifact.sections:
+            return _EMPTY_DIAGRAM
 
-        # Define styles
-        lines.append("classDef pass fill:#e6fffa,stroke:#00cc99,stroke-width:2px;")
-        lines.append("classDef warning fill:#fff4e6,stroke:#ff9900,stroke-width:2px;")
-        lines.append("classDef criticalGap fill:#ffcccc,stroke:#ff0000,stroke-width:2px;")
-        lines.append("classDef fail fill:#ffcccc,stroke:#ff0000,stroke-width:2px;")
-        lines.append("classDef code fill:#e6f7ff,stroke:#1890ff,stroke-width:1px;")
-        lines.append("classDef default fill:#ffffff,stroke:#000000;")
+        # Lines are streamed into one buffer, each prefixed by its separator, instead of being kept
+        # as one small str per line and joined at the end; getvalue() still copies the buffer once.
+        buf = io.StringIO()
+        emit = buf.write
+        emit(_EMPTY_DIAGRAM)
 
         # Maps for quick lookup
         req_to_tests = self.compliance_engine.map_requirements_to_tests(assay_report)
-        req_ids = {r.id for r in requirements}
+        max_coverage = self.compliance_engine.calculate_max_coverage(assay_report)
 
         # Safe Node ID Generation
         # We use internal IDs (e.g., node_1, node_2) to ensure valid Mermaid syntax
@@ -272,41 +343,35 @@ class TraceabilityMatrixBuilder:
                 node_id_map[real_id] = f"node_{node_counter}"
             return node_id_map[real_id]
 
+        # Requirement IDs are numbered lazily, at first use, so node IDs keep their established order.
+        req_ids = {req.id for req in requirements}
+
         # 1. Code Nodes (from DraftArtifact)
         for section in draft_artifact.sections:
             nid = get_node_id(section.id)
-            # Escape quotes in label if necessary (basic replacement)
-            label = section.id.replace('"', "'")
-            lines.append(f'{nid}["{label}"]:::code')
+            label = section.id.translate(_LABEL_ESCAPES)
+            emit(f'\n{nid}["{label}"]:::code')
 
-            for linked_req in section.linked_requirements:
+            # dict.fromkeys drops repeated links while keeping output order deterministic
+            for linked_req in dict.fromkeys(section.linked_requirements):
                 if linked_req in req_ids:
-                    req_nid = get_node_id(linked_req)
-                    lines.append(f"{nid} --> {req_nid}")
+                    emit(f"\n{nid} --> {get_node_id(linked_req)}")
 
         # 2. Requirement Nodes
         for req in requirements:
             nid = get_node_id(req.id)
-            linked_tests = req_to_tests.get(req.id, [])
-            coverage = self.compliance_engine.calculate_requirement_coverage(linked_tests)
-            gap_result = RiskAnalyzer.analyze_coverage(req, coverage)
+            linked_tests = req_to_tests.get(req.id, ())
+            gap_result = RiskAnalyzer.analyze_coverage(req, max_coverage.get(req.id, 0.0))
 
             # Assign style class
-            style_class = "default"
-            if gap_result.status == ComplianceStatus.PASS:
-                style_class = "pass"
-            elif gap_result.status == ComplianceStatus.WARNING:
-                style_class = "warning"
-            elif gap_result.status == ComplianceStatus.CRITICAL_GAP:
-                style_class = "criticalGap"
-
-            label = req.id.replace('"', "'")
-            lines.append(f'{nid}["{label}<br/>{req.risk.value}"]:::{style_class}')
-
-            # Link Requirement to Tests
-            for test in linked_tests:
-                test_nid = get_node_id(test.test_id)
-                lines.append(f"{nid} --> {test_nid}")
+            style_class = _STATUS_STYLES.get(gap_result.status, "default")
+
+            label = req.id.translate(_LABEL_ESCAPES)
+            emit(f'\n{nid}["{label}<br/>{req.risk.value}"]:::{style_class}')
+
+            # Link Requirement to Tests (once per test node, even if a result repeats the link)
+            for test_nid in dict.fromkeys(get_node_id(test.test_id) for test in linked_tests):
+                emit(f"\n{nid} --> {test_nid}")
 
         # 3. Test Nodes
         # We need to render test nodes only once.
@@ -315,8 +380,8 @@ class TraceabilityMatrixBuilder:
             if result.test_id not in rendered_tests:
                 nid = get_node_id(result.test_id)
                 style_class = "pass" if result.status == AssayStatus.PASS else "fail"
-                label = result.test_id.replace('"', "'")
-                lines.append(f'{nid}["{label}<br/>{result.status.value}"]:::{style_class}')
+                label = result.test_id.translate(_LABEL_ESCAPES)
+                emit(f'\n{nid}["{label}<br/>{result.status.value}"]:::{style_class}')
                 rendered_tests.add(result.test_id)
 
-        return "\n".join(lines)
+        return buf.getvalue()
@@ -8,15 +8,56 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
 
 from coreason_scribe.models import DraftArtifact
 from coreason_scribe.utils.logger import logger
 
+# The templates shipped with the package.
+_DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+@lru_cache(maxsize=16)
+def _build_env(template_dir: str) -> Environment:
+    """
+    Returns the Jinja2 Environment for a template directory, creating it on first use.
+
+    Sharing one Environment per directory keeps its compiled-template cache alive across
+    PDFGenerator instances, so each template is parsed and compiled only once per process.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+
+
+# Font configurations per template directory, guarded by _FONT_CONFIG_LOCK.
+_FONT_CONFIGS: Dict[str, FontConfiguration] = {}
+_FONT_CONFIG_LOCK = threading.Lock()
+
+
+def _font_config(template_dir: str) -> FontConfiguration:
+    """
+    Returns the WeasyPrint font configuration for a template directory, creating it on first use.
+
+    Building a FontConfiguration loads the system fontconfig setup and scans the installed fonts,
+    which WeasyPrint would otherwise repeat for every PDF it writes. WeasyPrint also registers each
+    document's @font-face rules on it, so each template directory gets its own configuration and
+    custom fonts never leak into documents rendered from other templates.
+    """
+    with _FONT_CONFIG_LOCK:
+        config = _FONT_CONFIGS.get(template_dir)
+        if config is None:
+            config = _FONT_CONFIGS[template_dir] = FontConfiguration()
+        return config
+
 
 class PDFGenerator:
     """
@@ -26,11 +67,9 @@ class PDFGenerator:
     def __init__(self, template_dir: Optional[Path] = None):
         if template_dir is None:
             # Default to the templates directory within the package
-            template_dir = Path(__file__).parent / "templates"
+            template_dir = _DEFAULT_TEMPLATE_DIR
 
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)), autoescape=select_autoescape(["html", "xml"])
-        )
+        self.env = _build_env(str(template_dir))
         self.template_dir = template_dir
 
     def generate_sds(self, artifact: DraftArtifact, output_path: Path) -> None:
@@ -47,6 +86,7 @@ class PDFGenerator:
         html_content = template.render(artifact=artifact)
 
         # We need to resolve relative paths (like style.css) relative to the template directory
-        HTML(string=html_content, base_url=str(self.template_dir)).write_pdf(output_path)
+        template_dir = str(self.template_dir)
+        HTML(string=html_content, base_url=template_dir).write_pdf(output_path, font_config=_font_config(template_dir))
 
         logger.info(f"SDS generated at {output_path}")
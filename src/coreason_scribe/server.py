@@ -8,7 +8,6 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-import shutil
 import tempfile
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -64,25 +63,17 @@ async def create_draft(
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Process uploads
+        # Validate uploads straight from their spooled streams
         if agent_yaml:
-            yaml_path = temp_path / "agent.yaml"
-            with open(yaml_path, "wb") as f:
-                shutil.copyfileobj(agent_yaml.file, f)
             try:
-                # Validate requirements
-                reqs = app.state.matrix_builder.load_requirements(yaml_path)
+                reqs = app.state.matrix_builder.load_requirements_stream(agent_yaml.file)
                 logger.info(f"Validated {len(reqs)} requirements from agent.yaml")
             except Exception as e:
                 raise HTTPException(status_code=422, detail=f"Invalid agent.yaml: {str(e)}") from e
 
         if assay_report:
-            report_path = temp_path / "assay_report.json"
-            with open(report_path, "wb") as f:
-                shutil.copyfileobj(assay_report.file, f)
             try:
-                # Validate report
-                report = app.state.matrix_builder.load_assay_report(report_path)
+                report = app.state.matrix_builder.load_assay_report_stream(assay_report.file)
                 logger.info(f"Validated assay report {report.id} with {len(report.results)} results")
             except Exception as e:
                 raise HTTPException(status_code=422, detail=f"Invalid assay_report.json: {str(e)}") from e
@@ -108,39 +99,26 @@ async def check_compliance(
 ) -> Union[Dict[str, str], JSONResponse]:
     logger.info("Received compliance check request")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Save uploaded files
-        yaml_path = temp_path / "agent.yaml"
-        report_path = temp_path / "assay_report.json"
-
-        with open(yaml_path, "wb") as f:
-            shutil.copyfileobj(agent_yaml.file, f)
-
-        with open(report_path, "wb") as f:
-            shutil.copyfileobj(assay_report.file, f)
+    try:
+        # Load and parse straight from the spooled uploads
+        reqs = app.state.matrix_builder.load_requirements_stream(agent_yaml.file)
+        report = app.state.matrix_builder.load_assay_report_stream(assay_report.file)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid input files: {str(e)}") from e
 
-        try:
-            # Load and parse
-            reqs = app.state.matrix_builder.load_requirements(yaml_path)
-            report = app.state.matrix_builder.load_assay_report(report_path)
-        except Exception as e:
-            raise HTTPException(status_code=422, detail=f"Invalid input files: {str(e)}") from e
-
-        # Evaluate compliance
-        try:
-            statuses = app.state.matrix_builder.compliance_engine.evaluate_compliance(reqs, report)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Compliance evaluation failed: {str(e)}") from e
+    # Evaluate compliance
+    try:
+        statuses = app.state.matrix_builder.compliance_engine.evaluate_compliance(reqs, report)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Compliance evaluation failed: {str(e)}") from e
 
-        # Check for critical gaps
-        has_critical_gap = any(status == ComplianceStatus.CRITICAL_GAP for status in statuses.values())
+    # Check for critical gaps
+    has_critical_gap = any(status == ComplianceStatus.CRITICAL_GAP for status in statuses.values())
 
-        if has_critical_gap:
-            return JSONResponse(status_code=422, content={k: v.value for k, v in statuses.items()})
+    if has_critical_gap:
+        return JSONResponse(status_code=422, content={k: v.value for k, v in statuses.items()})
 
-        return {k: v.value for k, v in statuses.items()}
+    return {k: v.value for k, v in statuses.items()}
 
 
 @app.get("/health")
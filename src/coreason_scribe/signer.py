@@ -93,11 +93,13 @@ class SigningRoom:
         # Calculate Hash
         # We hash the string representation of the sections and version to ensure integrity.
         # In a real PDF scenario, we might hash the PDF bytes. Here we hash the content.
-        content_to_hash = f"{artifact.version}:{artifact.timestamp.isoformat()}"
+        # Sections are fed to the digest one at a time, which yields the same hash as hashing the
+        # concatenated string without ever building it.
+        digest = hashlib.sha256(f"{artifact.version}:{artifact.timestamp.isoformat()}".encode("utf-8"))
         for section in artifact.sections:
-            content_to_hash += f":{section.id}:{section.content}:{section.linked_code_hash}"
+            digest.update(f":{section.id}:{section.content}:{section.linked_code_hash}".encode("utf-8"))
 
-        document_hash = hashlib.sha256(content_to_hash.encode("utf-8")).hexdigest()
+        document_hash = digest.hexdigest()
 
         # Create Signature Block
         signature = SignatureBlock(
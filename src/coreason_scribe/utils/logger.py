@@ -26,13 +26,18 @@ logger.add(
     "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
 )
 
+
+def _ensure_log_dir(path: Path) -> None:
+    """Creates the log directory (and any parents) if it does not exist yet."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
 # Ensure logs directory exists
 log_path = Path("logs")
-if not log_path.exists():  # pragma: no cover
-    log_path.mkdir(parents=True, exist_ok=True)
+_ensure_log_dir(log_path)
 
 # Sink 2: File (JSON, Rotation, Retention)
-logger.add(
+_file_sink_id = logger.add(
     "logs/app.log",
     rotation="500 MB",
     retention="10 days",
@@ -17,6 +17,8 @@ from unittest.mock import MagicMock
 mock_weasyprint = MagicMock()
 mock_weasyprint.HTML = MagicMock()
 sys.modules["weasyprint"] = mock_weasyprint
+sys.modules["weasyprint.text"] = mock_weasyprint.text
+sys.modules["weasyprint.text.fonts"] = mock_weasyprint.text.fonts
 
 # Mock coreason-identity
 mock_identity = MagicMock()
@@ -54,7 +56,26 @@ from unittest.mock import patch  # noqa: E402
 
 import pytest  # noqa: E402
 
+from coreason_scribe.matrix import TraceabilityMatrixBuilder  # noqa: E402
 from coreason_scribe.models import AssayReport, AssayResult, Requirement  # noqa: E402
+from coreason_scribe.utils.logger import _file_sink_id, logger  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _detach_file_log_sink() -> None:
+    """
+    Drops the JSON file sink for the test session so log calls never hit logs/app.log.
+    The stderr sink stays for failure output; tests that assert on log records add their own sink.
+    """
+    logger.remove(_file_sink_id)
+
+
+@pytest.fixture(scope="module")
+def builder() -> TraceabilityMatrixBuilder:
+    """
+    One builder per test module; loading and rendering leave it unchanged, so its tests can share it.
+    """
+    return TraceabilityMatrixBuilder()
 
 
 @pytest.fixture
@@ -64,6 +85,9 @@ def mock_traceability_context() -> Callable[
     """
     Returns a context manager that mocks the TraceabilityMatrixBuilder
     to return specific requirements and assay results.
+
+    The yielded paths are never created: the mocked builder is the only
+    consumer of the files, so no filesystem work is needed.
     """
 
     @contextmanager
@@ -72,8 +96,6 @@ def mock_traceability_context() -> Callable[
     ) -> Generator[Tuple[Path, Path], None, None]:
         agent_yaml = tmp_path / "agent.yaml"
         assay_report_path = tmp_path / "report.json"
-        agent_yaml.touch()
-        assay_report_path.touch()
 
         # Create the report object to return
         report = AssayReport(
@@ -0,0 +1,77 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason-scribe
+
+
+"""
+Shared values and Mermaid parsing helpers for the test modules, importable as ``helpers``
+because pytest puts tests/ on sys.path.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Fixed timestamp for every model built in the tests; no test depends on the wall clock.
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# NOW as it appears in serialized reports.
+NOW_ISO = NOW.isoformat()
+
+
+def parse_mermaid(
+    diagram: str,
+) -> Tuple[Dict[str, str], List[Tuple[str, str]], Dict[str, str], Dict[str, str]]:
+    """
+    Parses a Mermaid graph to extract:
+    - Nodes: {node_id: label}
+    - Edges: [(src_id, dst_id)]
+    - Styles: {node_id: style_class}
+    - By label: {label text before <br/>: node_id}
+    """
+    nodes = {}
+    edges = []
+    styles = {}
+    by_label: Dict[str, str] = {}
+
+    for line in diagram.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        # Check node def first: node_id["label"]:::style
+        # The label might contain <br/>, spaces or even " --> ", but never a double quote.
+        start = line.find('["')
+        end = line.rfind('"]')
+        if start > 0 and end > start:
+            nid = line[:start]
+            label = line[start + 2 : end]
+            nodes[nid] = label
+            by_label.setdefault(label.partition("<br/>")[0], nid)
+            _, _, style = line[end + 2 :].partition(":::")
+            if style:
+                styles[nid] = style
+            continue
+
+        # Otherwise an edge: src --> dst (generated node IDs only, never a quoted label)
+        src, sep, dst = line.partition(" --> ")
+        if sep:
+            edges.append((src, dst))
+
+    return nodes, edges, styles, by_label
+
+
+def find_node_id_by_label_content(by_label: Dict[str, str], content_snippet: str) -> Optional[str]:
+    # Snippets are usually the full object ID, which is a direct hit in the index.
+    nid = by_label.get(content_snippet)
+    if nid is not None:
+        return nid
+    for label, nid in by_label.items():
+        if content_snippet in label:
+            return nid
+    return None
@@ -9,99 +9,87 @@
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
 import math
+from typing import List, Optional
 
 import pytest
 
-from coreason_scribe.matrix import ComplianceStatus, RiskAnalyzer
-from coreason_scribe.models import Requirement, RiskLevel
-
-
-def test_analyze_high_risk_full_coverage() -> None:
-    req = Requirement(id="REQ-001", description="Patient safety", risk=RiskLevel.HIGH)
-    result = RiskAnalyzer.analyze_coverage(req, 100.0)
-
-    assert result.status == ComplianceStatus.PASS
-    assert result.requirement_id == "REQ-001"
-    assert result.risk_level == RiskLevel.HIGH
-    assert result.coverage_percentage == 100.0
-
-
-def test_analyze_high_risk_partial_coverage() -> None:
-    req = Requirement(id="REQ-002", description="Patient safety", risk=RiskLevel.HIGH)
-    result = RiskAnalyzer.analyze_coverage(req, 99.9)
-
-    assert result.status == ComplianceStatus.CRITICAL_GAP
-    assert "Requires 100%" in result.message
-    assert result.coverage_percentage == 99.9
-
-
-def test_analyze_high_risk_zero_coverage() -> None:
-    req = Requirement(id="REQ-003", description="Patient safety", risk=RiskLevel.HIGH)
-    result = RiskAnalyzer.analyze_coverage(req, 0.0)
-
-    assert result.status == ComplianceStatus.CRITICAL_GAP
-
-
-def test_analyze_med_risk_partial_coverage() -> None:
-    req = Requirement(id="REQ-004", description="Business Logic", risk=RiskLevel.MED)
-    result = RiskAnalyzer.analyze_coverage(req, 50.0)
-
-    assert result.status == ComplianceStatus.WARNING
-    assert "MED Risk" in result.message
-
-
-def test_analyze_low_risk_partial_coverage() -> None:
-    req = Requirement(id="REQ-005", description="UI", risk=RiskLevel.LOW)
-    result = RiskAnalyzer.analyze_coverage(req, 80.0)
-
-    assert result.status == ComplianceStatus.WARNING
-
-
-def test_analyze_low_risk_full_coverage() -> None:
-    req = Requirement(id="REQ-006", description="UI", risk=RiskLevel.LOW)
-    result = RiskAnalyzer.analyze_coverage(req, 100.0)
-
-    assert result.status == ComplianceStatus.PASS
-
-
-def test_analyze_over_100_coverage() -> None:
-    req = Requirement(id="REQ-007", description="UI", risk=RiskLevel.LOW)
-    # We now raise ValueError explicitly
-    with pytest.raises(ValueError, match="must be between 0.0 and 100.0"):
-        RiskAnalyzer.analyze_coverage(req, 101.0)
-
-
-def test_analyze_negative_coverage() -> None:
-    req = Requirement(id="REQ-008", description="UI", risk=RiskLevel.LOW)
-    with pytest.raises(ValueError, match="must be between 0.0 and 100.0"):
-        RiskAnalyzer.analyze_coverage(req, -1.0)
-
-
-def test_analyze_precision_edge_case() -> None:
-    # 99.999999 should NOT pass for high risk
-    req = Requirement(id="REQ-009", description="Precision", risk=RiskLevel.HIGH)
-    val = 99.99999999
-    result = RiskAnalyzer.analyze_coverage(req, val)
-    assert result.status == ComplianceStatus.CRITICAL_GAP
-    assert result.coverage_percentage == val
-
-
-def test_analyze_nan_coverage() -> None:
-    req = Requirement(id="REQ-010", description="NaN", risk=RiskLevel.HIGH)
-    with pytest.raises(ValueError, match="must be a finite number"):
-        RiskAnalyzer.analyze_coverage(req, math.nan)
-
-
-def test_analyze_inf_coverage() -> None:
-    req = Requirement(id="REQ-011", description="Inf", risk=RiskLevel.HIGH)
-    with pytest.raises(ValueError, match="must be a finite number"):
-        RiskAnalyzer.analyze_coverage(req, math.inf)
-
-
-def test_analyze_tiny_coverage() -> None:
-    # Very small positive number
-    req = Requirement(id="REQ-012", description="Tiny", risk=RiskLevel.MED)
-    val = 1e-10
-    result = RiskAnalyzer.analyze_coverage(req, val)
-    assert result.status == ComplianceStatus.WARNING
-    assert result.coverage_percentage == val
+from coreason_scribe.matrix import ComplianceEngine, ComplianceStatus, RiskAnalyzer
+from coreason_scribe.models import AssayReport, AssayResult, AssayStatus, Requirement, RiskLevel
+
+from helpers import NOW
+
+# Built once at import; RiskAnalyzer never mutates the requirement it analyzes.
+_HIGH_REQ = Requirement(id="REQ-001", description="Patient safety", risk=RiskLevel.HIGH)
+_MED_REQ = Requirement(id="REQ-002", description="Business Logic", risk=RiskLevel.MED)
+_LOW_REQ = Requirement(id="REQ-003", description="UI", risk=RiskLevel.LOW)
+
+
+@pytest.mark.parametrize(
+    "req, coverage, expected_status, msg_fragment",
+    [
+        (_HIGH_REQ, 100.0, ComplianceStatus.PASS, "full coverage"),
+        (_HIGH_REQ, 99.9, ComplianceStatus.CRITICAL_GAP, "Requires 100%"),
+        (_HIGH_REQ, 0.0, ComplianceStatus.CRITICAL_GAP, "Requires 100%"),
+        # 99.999999 should NOT pass for high risk
+        (_HIGH_REQ, 99.99999999, ComplianceStatus.CRITICAL_GAP, "Requires 100%"),
+        (_MED_REQ, 50.0, ComplianceStatus.WARNING, "MED Risk"),
+        # Very small positive number
+        (_MED_REQ, 1e-10, ComplianceStatus.WARNING, "partial coverage"),
+        (_LOW_REQ, 80.0, ComplianceStatus.WARNING, "LOW Risk"),
+        (_LOW_REQ, 100.0, ComplianceStatus.PASS, None),
+    ],
+)
+def test_analyze(
+    req: Requirement, coverage: float, expected_status: ComplianceStatus, msg_fragment: Optional[str]
+) -> None:
+    result = RiskAnalyzer.analyze_coverage(req, coverage)
+
+    assert result.status == expected_status
+    assert result.requirement_id == req.id
+    assert result.risk_level == req.risk
+    assert result.coverage_percentage == coverage
+    if msg_fragment is not None:
+        assert msg_fragment in result.message
+
+
+@pytest.mark.parametrize(
+    "coverage, match",
+    [
+        (math.nan, "must be a finite number"),
+        (math.inf, "must be a finite number"),
+        (-1.0, "must be between 0.0 and 100.0"),
+        (101.0, "must be between 0.0 and 100.0"),
+    ],
+)
+def test_invalid_coverage_raises(coverage: float, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        RiskAnalyzer.analyze_coverage(_HIGH_REQ, coverage)
+
+
+def _result(test_id: str, coverage: float, linked: List[str]) -> AssayResult:
+    return AssayResult(
+        test_id=test_id,
+        status=AssayStatus.PASS,
+        coverage=coverage,
+        linked_requirements=linked,
+        timestamp=NOW,
+    )
+
+
+def test_calculate_max_coverage_matches_per_requirement_max() -> None:
+    report = AssayReport(
+        id="RPT",
+        timestamp=NOW,
+        results=[
+            _result("T1", 40.0, ["REQ-001", "REQ-002"]),
+            _result("T2", 90.0, ["REQ-001"]),
+            _result("T3", 0.0, ["REQ-003"]),
+        ],
+    )
+
+    max_coverage = ComplianceEngine.calculate_max_coverage(report)
+    mapping = ComplianceEngine.map_requirements_to_tests(report)
+
+    assert max_coverage == {"REQ-001": 90.0, "REQ-002": 40.0}
+    for req_id in ("REQ-001", "REQ-002", "REQ-003", "REQ-UNLINKED"):
+        assert max_coverage.get(req_id, 0.0) == ComplianceEngine.calculate_requirement_coverage(mapping.get(req_id, []))
@@ -8,7 +8,10 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-from datetime import datetime, timezone
+import re
+from typing import List, Set
+
+import pytest
 
 from coreason_scribe.matrix import TraceabilityMatrixBuilder
 from coreason_scribe.models import (
@@ -21,26 +24,54 @@ from coreason_scribe.models import (
     RiskLevel,
 )
 
+from helpers import NOW
 
-def test_generate_mermaid_complex_graph() -> None:
-    """
-    Verifies that the Mermaid.js diagram is generated correctly for a complex scenario
-    involving Code, Requirements, and Tests with various states.
-    """
-    builder = TraceabilityMatrixBuilder()
+# Every fragment the diagram must contain, keyed by the regex group name used to report it.
+_EXPECTED_FRAGMENTS = {
+    "header": "graph TD",
+    "class_pass": "classDef pass",
+    "class_warning": "classDef warning",
+    "class_critical_gap": "classDef criticalGap",
+    "class_fail": "classDef fail",
+    "code_safety": '["module.safety"]:::code',
+    "code_business": '["module.business"]:::code',
+    "code_quoted": "[\"module.'quoted'\"]:::code",
+    # REQ-001 -> PASS (High Risk, 100% Cov)
+    "req_pass": '["REQ-001<br/>HIGH"]:::pass',
+    # REQ-002 -> WARNING (Med Risk, 80% Cov)
+    "req_med_warning": '["REQ-002<br/>MED"]:::warning',
+    # REQ-003 -> WARNING (Low Risk, 0% Cov)
+    "req_low_warning": '["REQ-003<br/>LOW"]:::warning',
+    # REQ-004 -> CRITICAL GAP (High Risk, 0% Cov / No tests)
+    "req_critical_gap": '["REQ-004<br/>HIGH"]:::criticalGap',
+    "test_pass": '["test_safety_logic<br/>PASS"]:::pass',
+    "test_fail": '["test_ui_broken<br/>FAIL"]:::fail',
+}
+
+# One alternation over all fragments lets a single finditer pass over the diagram
+# answer every containment check at once. finditer never reports overlapping matches,
+# so entries added to _EXPECTED_FRAGMENTS must not overlap one another in the diagram.
+_DIAGRAM_PATTERN = re.compile("|".join(f"(?P<{name}>{re.escape(frag)})" for name, frag in _EXPECTED_FRAGMENTS.items()))
 
-    # 1. Define Requirements
-    reqs = [
+# The inputs below are never mutated by generate_mermaid_diagram, so they are
+# built once per module and shared by every test.
+
+
+@pytest.fixture(scope="module")
+def reqs() -> List[Requirement]:
+    return [
         Requirement(id="REQ-001", description="Safety Critical Logic", risk=RiskLevel.HIGH),
         Requirement(id="REQ-002", description="Business Rule", risk=RiskLevel.MED),
         Requirement(id="REQ-003", description="UI Formatting", risk=RiskLevel.LOW),
         Requirement(id="REQ-004", description="Unimplemented Req", risk=RiskLevel.HIGH),
     ]
 
-    # 2. Define Assay Report (Test Results)
-    report = AssayReport(
+
+@pytest.fixture(scope="module")
+def report() -> AssayReport:
+    return AssayReport(
         id="REPORT-2023-X",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[
             # REQ-001: High Risk, 100% Coverage -> PASS
             AssayResult(
@@ -48,7 +79,7 @@ def test_generate_mermaid_complex_graph() -> None:
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["REQ-001"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
             # REQ-002: Med Risk, 80% Coverage -> WARNING
             AssayResult(
@@ -56,7 +87,7 @@ def test_generate_mermaid_complex_graph() -> None:
                 status=AssayStatus.PASS,
                 coverage=80.0,
                 linked_requirements=["REQ-002"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
             # REQ-003: Low Risk, 0% Coverage (Fail) -> WARNING
             # (fail doesn't mean 0 coverage necessarily, but let's say 0 here)
@@ -65,16 +96,18 @@ def test_generate_mermaid_complex_graph() -> None:
                 status=AssayStatus.FAIL,
                 coverage=0.0,
                 linked_requirements=["REQ-003"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
             # REQ-004: No tests linked -> Will be Critical Gap
         ],
     )
 
-    # 3. Define Draft Artifact (Code Structure)
-    draft = DraftArtifact(
+
+@pytest.fixture(scope="module")
+def draft() -> DraftArtifact:
+    return DraftArtifact(
         version="1.0.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="module.safety",
@@ -103,44 +136,54 @@ def test_generate_mermaid_complex_graph() -> None:
         ],
     )
 
-    # Generate Diagram
-    diagram = builder.generate_mermaid_diagram(reqs, report, draft)
 
-    # Verify Output Structure
-    assert "graph TD" in diagram
+@pytest.fixture(scope="module")
+def diagram(
+    builder: TraceabilityMatrixBuilder, reqs: List[Requirement], report: AssayReport, draft: DraftArtifact
+) -> str:
+    """
+    The Mermaid.js diagram for a complex scenario involving Code, Requirements,
+    and Tests with various states.
+    """
+    return builder.generate_mermaid_diagram(reqs, report, draft)
 
-    # Verify Classes
-    assert "classDef pass" in diagram
-    assert "classDef warning" in diagram
-    assert "classDef criticalGap" in diagram
-    assert "classDef fail" in diagram
 
-    # Verify Code Nodes & Edges
-    # Use generic regex or substring checks because IDs are auto-generated (node_1, node_2...)
-    # But labels should be present.
-    assert '["module.safety"]:::code' in diagram
-    assert '["module.business"]:::code' in diagram
-    # Escaping check
-    assert "[\"module.'quoted'\"]:::code" in diagram
+@pytest.fixture(scope="module")
+def diagram_matches(diagram: str) -> Set[str]:
+    """
+    Group names of every expected fragment found in the diagram.
+    """
+    return {m.lastgroup for m in _DIAGRAM_PATTERN.finditer(diagram) if m.lastgroup}
+
+
+def test_mermaid_structure_and_classes(diagram_matches: Set[str]) -> None:
+    assert {"header", "class_pass", "class_warning", "class_critical_gap", "class_fail"} <= diagram_matches
 
-    # Verify Requirement Nodes & Styles
-    # REQ-001 -> PASS (High Risk, 100% Cov)
-    assert '["REQ-001<br/>HIGH"]:::pass' in diagram
-    # REQ-002 -> WARNING (Med Risk, 80% Cov)
-    assert '["REQ-002<br/>MED"]:::warning' in diagram
-    # REQ-003 -> WARNING (Low Risk, 0% Cov)
-    assert '["REQ-003<br/>LOW"]:::warning' in diagram
-    # REQ-004 -> CRITICAL GAP (High Risk, 0% Cov / No tests)
-    assert '["REQ-004<br/>HIGH"]:::criticalGap' in diagram
 
-    # Verify Test Nodes & Styles
-    assert '["test_safety_logic<br/>PASS"]:::pass' in diagram
-    assert '["test_ui_broken<br/>FAIL"]:::fail' in diagram
+def test_mermaid_code_nodes(diagram_matches: Set[str]) -> None:
+    # Node IDs are auto-generated (node_1, node_2...), so only the labels are matched.
+    # "code_quoted" doubles as the escaping check.
+    assert {"code_safety", "code_business", "code_quoted"} <= diagram_matches
 
-    # Verify Linkage (Logic Check)
+
+def test_mermaid_requirement_nodes(diagram_matches: Set[str]) -> None:
+    assert {"req_pass", "req_med_warning", "req_low_warning", "req_critical_gap"} <= diagram_matches
+
+
+def test_mermaid_test_nodes(diagram_matches: Set[str]) -> None:
+    assert {"test_pass", "test_fail"} <= diagram_matches
+
+
+def test_mermaid_edge_count(diagram: str) -> None:
     # Since we don't know the exact node IDs, we can't easily assert "node_1 --> node_2".
     # But we can check that we have enough arrows.
     # Code->Req links: 4 (Safety->Req1, Biz->Req2, Biz->Req3, Quoted->Req4)
     # Req->Test links: 3 (Req1->TestSafety, Req2->TestBiz, Req3->TestUI)
-    arrow_count = diagram.count("-->")
-    assert arrow_count == 7
+    assert diagram.count("-->") == 7
+
+
+def test_mermaid_node_ids_follow_first_use(diagram: str) -> None:
+    # Node IDs are handed out in order of first appearance, so code nodes come before the
+    # requirements they link to and regenerated diagrams keep the same numbering.
+    assert '\nnode_1["module.safety"]:::code\nnode_1 --> node_2' in diagram
+    assert '\nnode_2["REQ-001<br/>HIGH"]:::pass' in diagram
@@ -8,7 +8,6 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-from datetime import datetime, timezone
 
 from coreason_scribe.matrix import TraceabilityMatrixBuilder
 from coreason_scribe.models import (
@@ -21,6 +20,8 @@ from coreason_scribe.models import (
     RiskLevel,
 )
 
+from helpers import NOW
+
 
 def test_mermaid_empty_inputs() -> None:
     """
@@ -30,12 +31,12 @@ def test_mermaid_empty_inputs() -> None:
     reqs: list[Requirement] = []
     report = AssayReport(
         id="EMPTY",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[],
     )
     draft = DraftArtifact(
         version="0.0.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[],
     )
 
@@ -45,6 +46,7 @@ def test_mermaid_empty_inputs() -> None:
     assert "graph TD" in diagram
     assert "classDef pass" in diagram
     assert "-->" not in diagram
+    assert ":::" not in diagram
 
 
 def test_mermaid_special_characters() -> None:
@@ -62,21 +64,21 @@ def test_mermaid_special_characters() -> None:
 
     report = AssayReport(
         id="R1",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[
             AssayResult(
                 test_id="test:subtest(1)",
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["REQ(A):1"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             )
         ],
     )
 
     draft = DraftArtifact(
         version="1.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="func<int>",
@@ -119,28 +121,28 @@ def test_mermaid_disconnected_and_orphaned_nodes() -> None:
 
     report = AssayReport(
         id="R1",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[
             AssayResult(
                 test_id="test_orphan",
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["REQ-NONEXISTENT"],  # Linked to unknown req
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
             AssayResult(
                 test_id="test_linked",
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["REQ-TESTED"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
         ],
     )
 
     draft = DraftArtifact(
         version="1.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="code_orphan",  # No requirements
@@ -190,14 +192,14 @@ def test_mermaid_many_to_many() -> None:
     # One test verifies both requirements
     report = AssayReport(
         id="R",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[
             AssayResult(
                 test_id="T1",
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["R1", "R2"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             )
         ],
     )
@@ -205,7 +207,7 @@ def test_mermaid_many_to_many() -> None:
     # One code section implements both requirements
     draft = DraftArtifact(
         version="1",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="C1",
@@ -226,3 +228,81 @@ def test_mermaid_many_to_many() -> None:
     # R1 -> T1
     # R2 -> T1
     assert diagram.count("-->") == 4
+
+
+def test_mermaid_duplicate_links_emit_single_edge() -> None:
+    """
+    Verifies that repeated links (within a section, within a result, or across
+    results sharing a test_id) produce one edge each.
+    """
+    builder = TraceabilityMatrixBuilder()
+
+    reqs = [Requirement(id="R1", description="...", risk=RiskLevel.LOW)]
+    report = AssayReport(
+        id="R",
+        timestamp=NOW,
+        results=[
+            AssayResult(
+                test_id="T1",
+                status=AssayStatus.PASS,
+                coverage=100.0,
+                linked_requirements=["R1", "R1"],
+                timestamp=NOW,
+            ),
+            AssayResult(
+                test_id="T1",
+                status=AssayStatus.PASS,
+                coverage=100.0,
+                linked_requirements=["R1"],
+                timestamp=NOW,
+            ),
+        ],
+    )
+    draft = DraftArtifact(
+        version="1",
+        timestamp=NOW,
+        sections=[
+            DraftSection(
+                id="C1",
+                content="...",
+                author="HUMAN",
+                is_modified=False,
+                linked_requirements=["R1", "R1"],
+                linked_code_hash="h",
+            )
+        ],
+    )
+
+    diagram = builder.generate_mermaid_diagram(reqs, report, draft)
+
+    # C1 -> R1, R1 -> T1
+    assert diagram.count("-->") == 2
+
+
+def test_mermaid_line_breaks_in_ids_stay_on_one_line() -> None:
+    """
+    Line breaks inside an ID must not split a node definition across diagram lines.
+    """
+    builder = TraceabilityMatrixBuilder()
+    reqs = [Requirement(id="REQ\r\n1", description="Multi-line ID", risk=RiskLevel.LOW)]
+    report = AssayReport(id="R1", timestamp=NOW, results=[])
+    draft = DraftArtifact(
+        version="1.0",
+        timestamp=NOW,
+        sections=[
+            DraftSection(
+                id='mod\n"quoted"',
+                content="...",
+                author="HUMAN",
+                is_modified=False,
+                linked_requirements=["REQ\r\n1"],
+                linked_code_hash="123",
+            )
+        ],
+    )
+
+    diagram = builder.generate_mermaid_diagram(reqs, report, draft)
+
+    assert '["REQ  1<br/>LOW"]' in diagram
+    assert "[\"mod 'quoted'\"]:::code" in diagram
+    assert diagram.count("-->") == 1
@@ -1,6 +1,4 @@
-import re
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import List
 
 import pytest
 
@@ -15,88 +13,47 @@ from coreason_scribe.models import (
     RiskLevel,
 )
 
+from helpers import NOW, find_node_id_by_label_content, parse_mermaid
 
-def parse_mermaid(diagram: str) -> Tuple[Dict[str, str], List[Tuple[str, str]], Dict[str, str]]:
-    """
-    Parses a Mermaid graph to extract:
-    - Nodes: {node_id: label}
-    - Edges: [(src_id, dst_id)]
-    - Styles: {node_id: style_class}
-    """
-    nodes = {}
-    edges = []
-    styles = {}
-
-    # Regex for node definition: node_id["label"]:::style
-    # Note: label might contain <br/> or spaces
-    node_pattern = re.compile(r'(\w+)\["([^"]+)"\](?::{3}(\w+))?')
-    edge_pattern = re.compile(r"(\w+) --> (\w+)")
-
-    for line in diagram.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check node def
-        m_node = node_pattern.match(line)
-        if m_node:
-            nid, label, style = m_node.groups()
-            nodes[nid] = label
-            if style:
-                styles[nid] = style
-            continue
-
-        # Check edge
-        m_edge = edge_pattern.match(line)
-        if m_edge:
-            src, dst = m_edge.groups()
-            edges.append((src, dst))
-
-    return nodes, edges, styles
-
-
-def find_node_id_by_label_content(nodes: Dict[str, str], content_snippet: str) -> Optional[str]:
-    for nid, label in nodes.items():
-        if content_snippet in label:
-            return nid
-    return None
+# The fixture data below is hand-written and known to be valid, so the models are
+# built with model_construct to skip pydantic validation. Validation itself is covered in test_models.py.
 
 
 @pytest.fixture
 def sample_requirements() -> List[Requirement]:
     return [
-        Requirement(id="REQ-001", description="High Risk Req", risk=RiskLevel.HIGH),
-        Requirement(id="REQ-002", description="Low Risk Req", risk=RiskLevel.LOW),
-        Requirement(id="REQ-003", description="Covered High Risk", risk=RiskLevel.HIGH),
+        Requirement.model_construct(id="REQ-001", description="High Risk Req", risk=RiskLevel.HIGH),
+        Requirement.model_construct(id="REQ-002", description="Low Risk Req", risk=RiskLevel.LOW),
+        Requirement.model_construct(id="REQ-003", description="Covered High Risk", risk=RiskLevel.HIGH),
     ]
 
 
 @pytest.fixture
 def sample_assay_report() -> AssayReport:
-    return AssayReport(
+    return AssayReport.model_construct(
         id="RPT-001",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         results=[
-            AssayResult(
+            AssayResult.model_construct(
                 test_id="TEST-001",
                 status=AssayStatus.FAIL,
                 coverage=50.0,
                 linked_requirements=["REQ-001"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
-            AssayResult(
+            AssayResult.model_construct(
                 test_id="TEST-002",
                 status=AssayStatus.PASS,
                 coverage=80.0,
                 linked_requirements=["REQ-002"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
-            AssayResult(
+            AssayResult.model_construct(
                 test_id="TEST-003",
                 status=AssayStatus.PASS,
                 coverage=100.0,
                 linked_requirements=["REQ-003"],
-                timestamp=datetime.now(timezone.utc),
+                timestamp=NOW,
             ),
         ],
     )
@@ -104,11 +61,11 @@ def sample_assay_report() -> AssayReport:
 
 @pytest.fixture
 def sample_draft_artifact() -> DraftArtifact:
-    return DraftArtifact(
+    return DraftArtifact.model_construct(
         version="1.0.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
-            DraftSection(
+            DraftSection.model_construct(
                 id="module.func_a",
                 content="Function A",
                 author="AI",
@@ -116,7 +73,7 @@ def sample_draft_artifact() -> DraftArtifact:
                 linked_requirements=["REQ-001"],
                 linked_code_hash="hash1",
             ),
-            DraftSection(
+            DraftSection.model_construct(
                 id="module.func_b",
                 content="Function B",
                 author="HUMAN",
@@ -136,12 +93,12 @@ def test_generate_mermaid_diagram_structure(
     builder = TraceabilityMatrixBuilder()
     diagram = builder.generate_mermaid_diagram(sample_requirements, sample_assay_report, sample_draft_artifact)
 
-    nodes, edges, styles = parse_mermaid(diagram)
+    nodes, edges, styles, by_label = parse_mermaid(diagram)
 
     # Find IDs
-    req1_id = find_node_id_by_label_content(nodes, "REQ-001")
-    test1_id = find_node_id_by_label_content(nodes, "TEST-001")
-    code_id = find_node_id_by_label_content(nodes, "module.func_a")
+    req1_id = find_node_id_by_label_content(by_label, "REQ-001")
+    test1_id = find_node_id_by_label_content(by_label, "TEST-001")
+    code_id = find_node_id_by_label_content(by_label, "module.func_a")
 
     assert req1_id is not None
     assert test1_id is not None
@@ -152,6 +109,34 @@ def test_generate_mermaid_diagram_structure(
     assert (req1_id, test1_id) in edges
 
 
+def test_parse_mermaid_label_containing_arrow(sample_requirements: List[Requirement]) -> None:
+    """A node whose label contains " --> " is still read as a node, not as an edge."""
+    draft = DraftArtifact.model_construct(
+        version="1.0.0",
+        timestamp=NOW,
+        sections=[
+            DraftSection.model_construct(
+                id="a --> b",
+                content="Arrow in ID",
+                author="AI",
+                is_modified=False,
+                linked_requirements=["REQ-001"],
+                linked_code_hash="hash3",
+            ),
+        ],
+    )
+    report = AssayReport.model_construct(id="RPT-EMPTY", timestamp=NOW, results=[])
+    diagram = TraceabilityMatrixBuilder().generate_mermaid_diagram(sample_requirements, report, draft)
+
+    nodes, edges, styles, by_label = parse_mermaid(diagram)
+
+    code_id = find_node_id_by_label_content(by_label, "a --> b")
+    req1_id = find_node_id_by_label_content(by_label, "REQ-001")
+    assert code_id is not None and req1_id is not None
+    assert styles[code_id] == "code"
+    assert edges == [(code_id, req1_id)]
+
+
 def test_generate_mermaid_diagram_styles(
     sample_requirements: List[Requirement],
     sample_assay_report: AssayReport,
@@ -160,15 +145,15 @@ def test_generate_mermaid_diagram_styles(
     builder = TraceabilityMatrixBuilder()
     diagram = builder.generate_mermaid_diagram(sample_requirements, sample_assay_report, sample_draft_artifact)
 
-    nodes, edges, styles = parse_mermaid(diagram)
+    nodes, edges, styles, by_label = parse_mermaid(diagram)
 
     # Find IDs
-    req1 = find_node_id_by_label_content(nodes, "REQ-001")
-    req2 = find_node_id_by_label_content(nodes, "REQ-002")
-    req3 = find_node_id_by_label_content(nodes, "REQ-003")
+    req1 = find_node_id_by_label_content(by_label, "REQ-001")
+    req2 = find_node_id_by_label_content(by_label, "REQ-002")
+    req3 = find_node_id_by_label_content(by_label, "REQ-003")
 
-    test1 = find_node_id_by_label_content(nodes, "TEST-001")
-    test3 = find_node_id_by_label_content(nodes, "TEST-003")
+    test1 = find_node_id_by_label_content(by_label, "TEST-001")
+    test3 = find_node_id_by_label_content(by_label, "TEST-003")
 
     # Assert not None to satisfy mypy
     assert req1 and req2 and req3 and test1 and test3
@@ -198,8 +183,8 @@ def test_generate_mermaid_diagram_orphans(
     builder = TraceabilityMatrixBuilder()
     diagram = builder.generate_mermaid_diagram(sample_requirements, sample_assay_report, sample_draft_artifact)
 
-    nodes, edges, styles = parse_mermaid(diagram)
+    nodes, edges, styles, by_label = parse_mermaid(diagram)
 
-    req_orphan = find_node_id_by_label_content(nodes, "REQ-ORPHAN")
+    req_orphan = find_node_id_by_label_content(by_label, "REQ-ORPHAN")
     assert req_orphan is not None
     assert styles[req_orphan] == "criticalGap"
@@ -8,7 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-from datetime import datetime, timezone
+from typing import Any, Dict
 
 import pytest
 from pydantic import ValidationError
@@ -24,6 +24,8 @@ from coreason_scribe.models import (
     SignatureBlock,
 )
 
+from helpers import NOW
+
 
 def test_risk_level_enum() -> None:
     assert RiskLevel.HIGH == "HIGH"
@@ -78,35 +80,45 @@ def test_draft_section_invalid_author() -> None:
 
 
 def test_signature_block_valid() -> None:
-    now = datetime.now(timezone.utc)
     sig = SignatureBlock(
         document_hash="hash_123",
         signer_id="user_001",
         signer_role="Quality_Manager",
-        timestamp=now,
+        timestamp=NOW,
         meaning="I certify this.",
         signature_token="token_abc",
     )
     assert sig.signer_id == "user_001"
-    assert sig.timestamp == now
+    assert sig.timestamp == NOW
 
 
-def test_signature_block_invalid_types() -> None:
-    with pytest.raises(ValidationError):
-        SignatureBlock(
-            document_hash=123,  # type: ignore # Should be string
-            signer_id="u1",
-            signer_role="role",
-            timestamp="not-a-datetime",  # type: ignore # Should be datetime
-            meaning="meaning",
-            signature_token="token",
-        )
+_VALID_SIGNATURE: Dict[str, Any] = {
+    "document_hash": "hash",
+    "signer_id": "u1",
+    "signer_role": "role",
+    "timestamp": NOW,
+    "meaning": "meaning",
+    "signature_token": "token",
+}
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("document_hash", 123),  # Should be string
+        ("timestamp", "not-a-datetime"),  # Should be datetime
+    ],
+)
+def test_signature_block_invalid_types(field: str, value: Any) -> None:
+    # One invalid field per case keeps the error payload minimal; error_count() avoids rendering messages.
+    with pytest.raises(ValidationError) as exc_info:
+        SignatureBlock(**{**_VALID_SIGNATURE, field: value})
+    assert exc_info.value.error_count() == 1
 
 
 def test_draft_artifact_valid() -> None:
-    now = datetime.now(timezone.utc)
     section = DraftSection(id="s1", content="c", author="AI", is_modified=False, linked_code_hash="h")
-    artifact = DraftArtifact(version="1.0", timestamp=now, sections=[section])
+    artifact = DraftArtifact(version="1.0", timestamp=NOW, sections=[section])
     assert artifact.version == "1.0"
     assert len(artifact.sections) == 1
 
@@ -133,7 +145,6 @@ def test_diff_item_valid() -> None:
 
 
 def test_delta_report_valid() -> None:
-    now = datetime.now(timezone.utc)
-    report = DeltaReport(current_version="1.1", previous_version="1.0", timestamp=now, changes=[])
+    report = DeltaReport(current_version="1.1", previous_version="1.0", timestamp=NOW, changes=[])
     assert report.current_version == "1.1"
     assert len(report.changes) == 0
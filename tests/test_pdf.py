@@ -8,41 +8,51 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from coreason_scribe import pdf as pdf_module
 from coreason_scribe.models import DraftArtifact, DraftSection
 from coreason_scribe.pdf import PDFGenerator
 
+from helpers import NOW
 
-@pytest.fixture
-def mock_html_class() -> Generator[MagicMock, None, None]:
-    """Mock the WeasyPrint HTML class to avoid needing system dependencies."""
+
+def _write_fake_pdf(target: Path | str, **kwargs: object) -> None:
+    """Stand-in for HTML.write_pdf: creates the file so tests can check the output path."""
+    if isinstance(target, str):
+        target = Path(target)
+    # Create a fake PDF file
+    with open(target, "wb") as f:
+        f.write(b"%PDF-1.4 mock content")
+
+
+@pytest.fixture(scope="module")
+def _html_patcher() -> Generator[MagicMock, None, None]:
+    # The patch is entered once per module; mock_html_class resets it for each test.
+    # Module (not session) scope keeps the patch from leaking into other test modules.
     with patch("coreason_scribe.pdf.HTML") as mock:
-        # The mock instance returned by HTML(...)
-        mock_instance = mock.return_value
-
-        # When write_pdf is called, we just create the file to satisfy tests
-        def side_effect(target: Path | str) -> None:
-            if isinstance(target, str):
-                target = Path(target)
-            # Create a fake PDF file
-            with open(target, "wb") as f:
-                f.write(b"%PDF-1.4 mock content")
-
-        mock_instance.write_pdf.side_effect = side_effect
         yield mock
 
 
+@pytest.fixture
+def mock_html_class(_html_patcher: MagicMock) -> MagicMock:
+    """Mock the WeasyPrint HTML class to avoid needing system dependencies."""
+    # reset_mock clears call records on the class and every child mock, including HTML(...).write_pdf.
+    _html_patcher.reset_mock()
+    # When write_pdf is called, we just create the file to satisfy tests
+    _html_patcher.return_value.write_pdf.side_effect = _write_fake_pdf
+    return _html_patcher
+
+
 @pytest.fixture
 def sample_artifact() -> DraftArtifact:
     return DraftArtifact(
         version="1.0.0-rc1",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="module.auth",
@@ -86,17 +96,60 @@ def test_custom_template_dir(tmp_path: Path, mock_html_class: MagicMock) -> None
     generator = PDFGenerator(template_dir=tpl_dir)
     assert generator.env.loader is not None
 
-    art = DraftArtifact(version="v1", timestamp=datetime.now(), sections=[])
+    art = DraftArtifact(version="v1", timestamp=NOW, sections=[])
     out = tmp_path / "out.pdf"
     generator.generate_sds(art, out)
     assert out.exists()
 
 
+def test_environment_shared_per_template_dir(tmp_path: Path) -> None:
+    """Generators for the same template directory reuse one Environment (and its template cache)."""
+    assert PDFGenerator().env is PDFGenerator().env
+
+    tpl_dir = tmp_path / "templates"
+    tpl_dir.mkdir()
+    custom = PDFGenerator(template_dir=tpl_dir)
+    assert custom.env is PDFGenerator(template_dir=tpl_dir).env
+    assert custom.env is not PDFGenerator().env
+
+
+def test_font_config_shared_across_documents(
+    tmp_path: Path, sample_artifact: DraftArtifact, mock_html_class: MagicMock
+) -> None:
+    """Every PDF is written with the same FontConfiguration, so fonts are scanned once per process."""
+    PDFGenerator().generate_sds(sample_artifact, tmp_path / "a.pdf")
+    PDFGenerator().generate_sds(sample_artifact, tmp_path / "b.pdf")
+
+    first, second = mock_html_class.return_value.write_pdf.call_args_list
+    assert first.kwargs["font_config"] is second.kwargs["font_config"]
+
+
+def test_font_config_per_template_dir(
+    tmp_path: Path, sample_artifact: DraftArtifact, mock_html_class: MagicMock
+) -> None:
+    """Custom template directories get their own FontConfiguration, so @font-face rules stay isolated."""
+    tpl_dir = tmp_path / "templates"
+    tpl_dir.mkdir()
+    (tpl_dir / "sds.html").write_text("<html><body>{{ artifact.version }}</body></html>")
+
+    with (
+        patch.dict(pdf_module._FONT_CONFIGS, clear=True),
+        patch.object(pdf_module, "FontConfiguration", side_effect=lambda: MagicMock()),
+    ):
+        PDFGenerator().generate_sds(sample_artifact, tmp_path / "a.pdf")
+        PDFGenerator(template_dir=tpl_dir).generate_sds(sample_artifact, tmp_path / "b.pdf")
+        PDFGenerator(template_dir=tpl_dir).generate_sds(sample_artifact, tmp_path / "c.pdf")
+
+    default, custom, custom_again = mock_html_class.return_value.write_pdf.call_args_list
+    assert default.kwargs["font_config"] is not custom.kwargs["font_config"]
+    assert custom.kwargs["font_config"] is custom_again.kwargs["font_config"]
+
+
 def test_pdf_escapes_html(tmp_path: Path, mock_html_class: MagicMock) -> None:
     """Verify that HTML characters in content are escaped."""
     artifact = DraftArtifact(
         version="1.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="injection",
@@ -124,7 +177,7 @@ def test_pdf_unicode_content(tmp_path: Path, mock_html_class: MagicMock) -> None
     """Verify handling of unicode characters."""
     artifact = DraftArtifact(
         version="1.0",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
         sections=[
             DraftSection(
                 id="unicode", content="こんにちは world 🌍", author="AI", is_modified=False, linked_code_hash="h"
@@ -138,7 +191,7 @@ def test_pdf_unicode_content(tmp_path: Path, mock_html_class: MagicMock) -> None
 
 def test_pdf_empty_sections(tmp_path: Path, mock_html_class: MagicMock) -> None:
     """Verify generation with no sections."""
-    artifact = DraftArtifact(version="1.0", timestamp=datetime.now(timezone.utc), sections=[])
+    artifact = DraftArtifact(version="1.0", timestamp=NOW, sections=[])
     output_path = tmp_path / "empty.pdf"
     PDFGenerator().generate_sds(artifact, output_path)
     assert output_path.exists()
@@ -158,13 +211,14 @@ def test_pdf_invalid_output_path(tmp_path: Path, sample_artifact: DraftArtifact,
 
 def test_large_document(tmp_path: Path, mock_html_class: MagicMock) -> None:
     """Stress test with many sections."""
+    # The generated sections and artifact are valid by construction, so validation is skipped for speed.
     sections = [
-        DraftSection(
+        DraftSection.model_construct(
             id=f"sec.{i}", content=f"This is section {i}. " * 20, author="AI", is_modified=False, linked_code_hash="h"
         )
         for i in range(100)
     ]
-    artifact = DraftArtifact(version="1.0-large", timestamp=datetime.now(timezone.utc), sections=sections)
+    artifact = DraftArtifact.model_construct(version="1.0-large", timestamp=NOW, sections=sections)
     output_path = tmp_path / "large.pdf"
     PDFGenerator().generate_sds(artifact, output_path)
     assert output_path.exists()
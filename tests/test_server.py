@@ -10,27 +10,33 @@ from fastapi.testclient import TestClient
 
 from coreason_scribe.server import app
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
+    # Lifespan startup (inspector, matrix builder, PDF generator) runs once per module.
+    # Tests patch those components only through monkeypatch, so every patch is undone after each test.
     with TestClient(app) as c:
-        # Patch generate_sds to create a dummy file because weasyprint is mocked and doesn't write files
-        fastapi_app = cast(FastAPI, c.app)
-        original_generate_sds = fastapi_app.state.pdf_generator.generate_sds
+        yield c
 
-        def mock_generate_sds(artifact: Any, output_path: Any) -> None:
-            # Simulate PDF generation by creating an empty file
-            # But wait, st_size == 0 check will fail if empty.
-            output_path.write_text("dummy pdf content")
 
-        fastapi_app.state.pdf_generator.generate_sds = mock_generate_sds
+@pytest.fixture(autouse=True)
+def _reset_state(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Patch generate_sds to create a dummy file because weasyprint is mocked and doesn't write files
+    fastapi_app = cast(FastAPI, client.app)
 
-        yield c
+    def mock_generate_sds(artifact: Any, output_path: Any) -> None:
+        # Simulate PDF generation by creating a non-empty file (the server rejects empty output)
+        output_path.write_text("dummy pdf content")
 
-        fastapi_app.state.pdf_generator.generate_sds = original_generate_sds
+    monkeypatch.setattr(fastapi_app.state.pdf_generator, "generate_sds", mock_generate_sds)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_requirements_content() -> List[Dict[str, Any]]:
     return [
         {"id": "REQ-001", "description": "Must do X", "risk": "HIGH", "source_sop": "SOP-1"},
@@ -38,7 +44,7 @@ def sample_requirements_content() -> List[Dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_assay_report_content() -> Dict[str, Any]:
     return {
         "id": "report-1",
@@ -62,6 +68,28 @@ def sample_assay_report_content() -> Dict[str, Any]:
     }
 
 
+# The serialized uploads are built once per module and posted straight from memory, without touching disk.
+
+
+@pytest.fixture(scope="module")
+def sample_requirements_yaml(sample_requirements_content: List[Dict[str, Any]]) -> bytes:
+    return yaml.dump(sample_requirements_content, Dumper=_YamlDumper).encode()
+
+
+@pytest.fixture(scope="module")
+def sample_assay_report_json(sample_assay_report_content: Dict[str, Any]) -> bytes:
+    return json.dumps(sample_assay_report_content).encode()
+
+
+@pytest.fixture(scope="module")
+def critical_gap_report_json(sample_assay_report_content: Dict[str, Any]) -> bytes:
+    # Modify report to introduce a gap in HIGH risk requirement.
+    # Only the first result changes, so it is copied shallowly and the shared content is left untouched.
+    first, *rest = sample_assay_report_content["results"]
+    gap_result = {**first, "coverage": 50.0}  # Partial coverage for REQ-001 (HIGH RISK)
+    return json.dumps({**sample_assay_report_content, "results": [gap_result, *rest]}).encode()
+
+
 def test_health(client: TestClient) -> None:
     response = client.get("/health")
     assert response.status_code == 200
@@ -78,25 +106,14 @@ def test_draft_no_files(client: TestClient) -> None:
 
 def test_draft_with_files(
     client: TestClient,
-    sample_requirements_content: List[Dict[str, Any]],
-    sample_assay_report_content: Dict[str, Any],
-    tmp_path: Any,
+    sample_requirements_yaml: bytes,
+    sample_assay_report_json: bytes,
 ) -> None:
-    # Prepare files
-    agent_yaml = tmp_path / "agent.yaml"
-    with open(agent_yaml, "w") as f:
-        yaml.dump(sample_requirements_content, f)
-
-    assay_report = tmp_path / "assay_report.json"
-    with open(assay_report, "w") as f:
-        json.dump(sample_assay_report_content, f)
-
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/draft", data={"version": "1.0.0"}, files=files)
+    files = {
+        "agent_yaml": ("agent.yaml", sample_requirements_yaml, "application/yaml"),
+        "assay_report": ("assay_report.json", sample_assay_report_json, "application/json"),
+    }
+    response = client.post("/draft", data={"version": "1.0.0"}, files=files)
 
     if response.status_code != 200:
         print(response.json())
@@ -108,25 +125,14 @@ def test_draft_with_files(
 
 def test_check_pass(
     client: TestClient,
-    sample_requirements_content: List[Dict[str, Any]],
-    sample_assay_report_content: Dict[str, Any],
-    tmp_path: Any,
+    sample_requirements_yaml: bytes,
+    sample_assay_report_json: bytes,
 ) -> None:
-    # Prepare files
-    agent_yaml = tmp_path / "agent.yaml"
-    with open(agent_yaml, "w") as f:
-        yaml.dump(sample_requirements_content, f)
-
-    assay_report = tmp_path / "assay_report.json"
-    with open(assay_report, "w") as f:
-        json.dump(sample_assay_report_content, f)
-
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/check", files=files)
+    files = {
+        "agent_yaml": ("agent.yaml", sample_requirements_yaml, "application/yaml"),
+        "assay_report": ("assay_report.json", sample_assay_report_json, "application/json"),
+    }
+    response = client.post("/check", files=files)
 
     if response.status_code != 200:
         print(response.json())
@@ -139,78 +145,50 @@ def test_check_pass(
 
 def test_check_fail_critical_gap(
     client: TestClient,
-    sample_requirements_content: List[Dict[str, Any]],
-    sample_assay_report_content: Dict[str, Any],
-    tmp_path: Any,
+    sample_requirements_yaml: bytes,
+    critical_gap_report_json: bytes,
 ) -> None:
-    # Modify report to introduce a gap in HIGH risk requirement
-    import copy
-
-    content = copy.deepcopy(sample_assay_report_content)
-
-    content["results"][0]["coverage"] = 50.0  # Partial coverage for REQ-001 (HIGH RISK)
-
-    agent_yaml = tmp_path / "agent.yaml"
-    with open(agent_yaml, "w") as f:
-        yaml.dump(sample_requirements_content, f)
-
-    assay_report = tmp_path / "assay_report.json"
-    with open(assay_report, "w") as f:
-        json.dump(content, f)
-
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/check", files=files)
+    files = {
+        "agent_yaml": ("agent.yaml", sample_requirements_yaml, "application/yaml"),
+        "assay_report": ("assay_report.json", critical_gap_report_json, "application/json"),
+    }
+    response = client.post("/check", files=files)
 
     assert response.status_code == 422
     data = response.json()
     assert data["REQ-001"] == "CRITICAL_GAP"
 
 
-def test_draft_invalid_yaml(client: TestClient, tmp_path: Any) -> None:
-    agent_yaml = tmp_path / "agent.yaml"
-    agent_yaml.write_text("invalid: yaml: : content")
-
-    with open(agent_yaml, "rb") as f_yaml:
-        files = {"agent_yaml": ("agent.yaml", f_yaml, "application/yaml")}
-        response = client.post("/draft", data={"version": "1.0.0"}, files=files)
+def test_draft_invalid_yaml(client: TestClient) -> None:
+    files = {"agent_yaml": ("agent.yaml", b"invalid: yaml: : content", "application/yaml")}
+    response = client.post("/draft", data={"version": "1.0.0"}, files=files)
 
     assert response.status_code == 422
     assert "Invalid agent.yaml" in response.json()["detail"]
 
 
-def test_check_invalid_json(client: TestClient, tmp_path: Any) -> None:
-    agent_yaml = tmp_path / "agent.yaml"
-    agent_yaml.write_text("[]")  # valid yaml
-
-    assay_report = tmp_path / "assay_report.json"
-    assay_report.write_text("{ invalid json }")
-
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/check", files=files)
+def test_check_invalid_json(client: TestClient) -> None:
+    files = {
+        "agent_yaml": ("agent.yaml", b"[]", "application/yaml"),  # valid yaml
+        "assay_report": ("assay_report.json", b"{ invalid json }", "application/json"),
+    }
+    response = client.post("/check", files=files)
 
     assert response.status_code == 422
     assert "Invalid input files" in response.json()["detail"]
 
 
-def test_draft_pdf_generation_failure(client: TestClient) -> None:
+def test_draft_pdf_generation_failure(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     fastapi_app = cast(FastAPI, client.app)
     # Mock PDF generator to raise exception
-    fastapi_app.state.pdf_generator.generate_sds = MagicMock(side_effect=Exception("PDF Error"))
+    monkeypatch.setattr(fastapi_app.state.pdf_generator, "generate_sds", MagicMock(side_effect=Exception("PDF Error")))
 
     response = client.post("/draft", data={"version": "1.0.0"})
     assert response.status_code == 500
     assert "Failed to generate PDF" in response.json()["detail"]
 
 
-def test_draft_pdf_empty_failure(client: TestClient) -> None:
+def test_draft_pdf_empty_failure(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     fastapi_app = cast(FastAPI, client.app)
 
     # Mock generation that produces empty file (or doesn't produce one)
@@ -221,38 +199,32 @@ def test_draft_pdf_empty_failure(client: TestClient) -> None:
         # Or create empty file
         output_path.touch()
 
-    fastapi_app.state.pdf_generator.generate_sds = mock_empty_generate
+    monkeypatch.setattr(fastapi_app.state.pdf_generator, "generate_sds", mock_empty_generate)
 
     response = client.post("/draft", data={"version": "1.0.0"})
     assert response.status_code == 500
     assert "PDF file was not created or is empty" in response.json()["detail"]
 
 
-def test_check_compliance_evaluation_failure(client: TestClient, tmp_path: Any) -> None:
+def test_check_compliance_evaluation_failure(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     # Mock compliance engine to raise exception
     fastapi_app = cast(FastAPI, client.app)
 
     # We need to mock the evaluate_compliance method
     # Since matrix_builder is instantiated in lifespan, we access it via state
-    fastapi_app.state.matrix_builder.compliance_engine.evaluate_compliance = MagicMock(
-        side_effect=Exception("Engine Error")
+    monkeypatch.setattr(
+        fastapi_app.state.matrix_builder.compliance_engine,
+        "evaluate_compliance",
+        MagicMock(side_effect=Exception("Engine Error")),
     )
 
-    agent_yaml = tmp_path / "agent.yaml"
-    agent_yaml.write_text("[]")
-
-    assay_report = tmp_path / "assay_report.json"
-    assay_report.write_text("{}")  # Minimal valid JSON for load_assay_report to pass or fail gracefully
-
-    # Note: load_assay_report might fail on empty dict, so let's provide minimal valid structure
-    assay_report.write_text('{"id": "1", "timestamp": "2023-01-01T00:00:00Z", "results": []}')
-
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/check", files=files)
+    # load_assay_report fails on an empty dict, so provide a minimal valid structure
+    report = b'{"id": "1", "timestamp": "2023-01-01T00:00:00Z", "results": []}'
+    files = {
+        "agent_yaml": ("agent.yaml", b"[]", "application/yaml"),
+        "assay_report": ("assay_report.json", report, "application/json"),
+    }
+    response = client.post("/check", files=files)
 
     assert response.status_code == 500
     assert "Compliance evaluation failed" in response.json()["detail"]
@@ -260,26 +232,22 @@ def test_check_compliance_evaluation_failure(client: TestClient, tmp_path: Any)
 
 def test_draft_assay_report_generic_exception(
     client: TestClient,
-    sample_requirements_content: List[Dict[str, Any]],
-    tmp_path: Any,
+    sample_requirements_yaml: bytes,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     # Force generic exception during assay report loading in draft endpoint
     fastapi_app = cast(FastAPI, client.app)
-    fastapi_app.state.matrix_builder.load_assay_report = MagicMock(side_effect=Exception("Generic Load Error"))
-
-    agent_yaml = tmp_path / "agent.yaml"
-    with open(agent_yaml, "w") as f:
-        yaml.dump(sample_requirements_content, f)
-
-    assay_report = tmp_path / "assay_report.json"
-    assay_report.write_text("{}")
+    monkeypatch.setattr(
+        fastapi_app.state.matrix_builder,
+        "load_assay_report_stream",
+        MagicMock(side_effect=Exception("Generic Load Error")),
+    )
 
-    with open(agent_yaml, "rb") as f_yaml, open(assay_report, "rb") as f_json:
-        files = {
-            "agent_yaml": ("agent.yaml", f_yaml, "application/yaml"),
-            "assay_report": ("assay_report.json", f_json, "application/json"),
-        }
-        response = client.post("/draft", data={"version": "1.0.0"}, files=files)
+    files = {
+        "agent_yaml": ("agent.yaml", sample_requirements_yaml, "application/yaml"),
+        "assay_report": ("assay_report.json", b"{}", "application/json"),
+    }
+    response = client.post("/draft", data={"version": "1.0.0"}, files=files)
 
     assert response.status_code == 422
     assert "Invalid assay_report.json" in response.json()["detail"]
@@ -10,19 +10,23 @@
 
 import hashlib
 from datetime import datetime, timezone
+from typing import Tuple
 
 import pytest
 
 from coreason_scribe.models import DocumentState, DraftArtifact, DraftSection
 from coreason_scribe.signer import MockIdentityProvider, SigningRoom
 
+# The provider and signing room hold no per-document state (SigningRoom only keeps the provider),
+# so one instance of each is shared by every test in the module.
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_id_provider() -> MockIdentityProvider:
     return MockIdentityProvider()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def signing_room(mock_id_provider: MockIdentityProvider) -> SigningRoom:
     return SigningRoom(mock_id_provider)
 
@@ -50,23 +54,12 @@ def test_submit_for_review(signing_room: SigningRoom, draft_artifact: DraftArtif
     assert updated_artifact.status == DocumentState.PENDING_REVIEW
 
 
-def test_submit_for_review_invalid_state(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
-    draft_artifact.status = DocumentState.APPROVED
-    with pytest.raises(ValueError, match="expected DRAFT"):
-        signing_room.submit_for_review(draft_artifact)
-
-
 def test_approve(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
     draft_artifact.status = DocumentState.PENDING_REVIEW
     updated_artifact = signing_room.approve(draft_artifact, "user1")
     assert updated_artifact.status == DocumentState.APPROVED
 
 
-def test_approve_invalid_state(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
-    with pytest.raises(ValueError, match="expected PENDING_REVIEW"):
-        signing_room.approve(draft_artifact, "user1")
-
-
 def test_sign_success(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
     draft_artifact.status = DocumentState.APPROVED
     updated_artifact = signing_room.sign(draft_artifact, "user1", "Quality_Manager", "correct-password")
@@ -79,10 +72,25 @@ def test_sign_success(signing_room: SigningRoom, draft_artifact: DraftArtifact)
     assert len(updated_artifact.signature.document_hash) == 64  # SHA256 length
 
 
-def test_sign_invalid_state(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
-    # Default is DRAFT
-    with pytest.raises(ValueError, match="expected APPROVED"):
-        signing_room.sign(draft_artifact, "user1", "role", "correct-password")
+@pytest.mark.parametrize(
+    "state, action, args, msg",
+    [
+        (DocumentState.APPROVED, "submit_for_review", (), "expected DRAFT"),
+        (DocumentState.DRAFT, "approve", ("user1",), "expected PENDING_REVIEW"),
+        (DocumentState.DRAFT, "sign", ("user1", "role", "correct-password"), "expected APPROVED"),
+    ],
+)
+def test_invalid_state_transitions(
+    signing_room: SigningRoom,
+    draft_artifact: DraftArtifact,
+    state: DocumentState,
+    action: str,
+    args: Tuple[str, ...],
+    msg: str,
+) -> None:
+    draft_artifact.status = state
+    with pytest.raises(ValueError, match=msg):
+        getattr(signing_room, action)(draft_artifact, *args)
 
 
 def test_sign_auth_failure(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
@@ -231,3 +239,21 @@ def test_signature_integrity_verification(signing_room: SigningRoom, draft_artif
 
     assert draft_artifact.signature is not None
     assert draft_artifact.signature.document_hash == expected_hash
+
+
+def test_multi_section_hash_covers_every_section(signing_room: SigningRoom, draft_artifact: DraftArtifact) -> None:
+    """
+    The document hash is taken over the version, timestamp and every section in order.
+    """
+    draft_artifact.sections.append(
+        DraftSection(id="sec2", content="content2", author="AI", is_modified=True, linked_code_hash="hash2")
+    )
+    draft_artifact.status = DocumentState.APPROVED
+    signing_room.sign(draft_artifact, "signer", "role", "correct-password")
+
+    expected_str = f"{draft_artifact.version}:{draft_artifact.timestamp.isoformat()}"
+    expected_str += ":sec1:content1:hash1:sec2:content2:hash2"
+    expected_hash = hashlib.sha256(expected_str.encode("utf-8")).hexdigest()
+
+    assert draft_artifact.signature is not None
+    assert draft_artifact.signature.document_hash == expected_hash
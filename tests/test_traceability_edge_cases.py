@@ -8,162 +8,139 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
+import io
 import json
-from pathlib import Path
 
 import pytest
-import yaml
 
 from coreason_scribe.matrix import TraceabilityMatrixBuilder
 
+from helpers import NOW_ISO
 
-@pytest.fixture
-def builder() -> TraceabilityMatrixBuilder:
-    return TraceabilityMatrixBuilder()
 
+def test_load_requirements_empty_list(builder: TraceabilityMatrixBuilder) -> None:
+    stream = io.BytesIO(b"[]\n")
 
-def test_load_requirements_empty_list(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    file_path = tmp_path / "empty.yaml"
-    with open(file_path, "w") as f:
-        yaml.dump([], f)
-
-    reqs = builder.load_requirements(file_path)
+    reqs = builder.load_requirements_stream(stream)
     assert reqs == []
 
 
-def test_load_requirements_unicode(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = [{"id": "REQ-emoji", "description": "Handles unicode: 🚀 你好", "risk": "LOW"}]
-    file_path = tmp_path / "unicode.yaml"
-    with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f)
+def test_load_requirements_unicode(builder: TraceabilityMatrixBuilder) -> None:
+    # Raw UTF-8 rather than escapes, so the loader has to decode it
+    stream = io.BytesIO('- id: REQ-emoji\n  description: "Handles unicode: 🚀 你好"\n  risk: LOW\n'.encode())
 
-    reqs = builder.load_requirements(file_path)
+    reqs = builder.load_requirements_stream(stream)
     assert reqs[0].id == "REQ-emoji"
     assert reqs[0].description == "Handles unicode: 🚀 你好"
 
 
-def test_load_assay_report_empty_results(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {"id": "REPORT-EMPTY", "timestamp": "2025-01-01T12:00:00", "results": []}
-    file_path = tmp_path / "empty_results.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
-
-    report = builder.load_assay_report(file_path)
-    assert report.id == "REPORT-EMPTY"
-    assert report.results == []
-
+# Report payloads never change between runs, so each is serialized once at import.
+_EMPTY_RESULTS_JSON = json.dumps({"id": "REPORT-EMPTY", "timestamp": NOW_ISO, "results": []}).encode()
 
-def test_load_assay_report_complex_links(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {
+_COMPLEX_LINKS_JSON = json.dumps(
+    {
         "id": "REPORT-COMPLEX",
-        "timestamp": "2025-01-01T12:00:00",
+        "timestamp": NOW_ISO,
         "results": [
             {
                 "test_id": "TEST-MANY",
                 "status": "PASS",
                 "coverage": 95.5,
                 "linked_requirements": ["REQ-001", "REQ-002", "REQ-003"],
-                "timestamp": "2025-01-01T12:00:00",
+                "timestamp": NOW_ISO,
             },
             {
                 "test_id": "TEST-NONE",
                 "status": "SKIPPED",
                 "coverage": 0.0,
                 "linked_requirements": [],
-                "timestamp": "2025-01-01T12:00:00",
+                "timestamp": NOW_ISO,
             },
         ],
     }
-    file_path = tmp_path / "complex.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
-
-    report = builder.load_assay_report(file_path)
-    assert len(report.results) == 2
-    assert len(report.results[0].linked_requirements) == 3
-    assert report.results[1].linked_requirements == []
+).encode()
 
-
-def test_assay_coverage_boundaries(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    # Test 0.0 and 100.0 (Valid)
-    data_valid = {
+# 0.0 and 100.0 are both valid coverage values
+_BOUNDARIES_JSON = json.dumps(
+    {
         "id": "REPORT-BOUNDARIES",
-        "timestamp": "2025-01-01T12:00:00",
+        "timestamp": NOW_ISO,
         "results": [
             {
                 "test_id": "TEST-ZERO",
                 "status": "FAIL",
                 "coverage": 0.0,
                 "linked_requirements": [],
-                "timestamp": "2025-01-01T12:00:00",
+                "timestamp": NOW_ISO,
             },
             {
                 "test_id": "TEST-FULL",
                 "status": "PASS",
                 "coverage": 100.0,
                 "linked_requirements": [],
-                "timestamp": "2025-01-01T12:00:00",
+                "timestamp": NOW_ISO,
             },
         ],
     }
-    file_path = tmp_path / "valid_boundaries.json"
-    with open(file_path, "w") as f:
-        json.dump(data_valid, f)
-
-    report = builder.load_assay_report(file_path)
-    assert report.results[0].coverage == 0.0
-    assert report.results[1].coverage == 100.0
+).encode()
+
+
+def _single_result_json(coverage: float) -> bytes:
+    return json.dumps(
+        {
+            "id": "REPORT-BAD-COV",
+            "timestamp": NOW_ISO,
+            "results": [
+                {
+                    "test_id": "TEST-BAD-COV",
+                    "status": "PASS",
+                    "coverage": coverage,
+                    "linked_requirements": [],
+                    "timestamp": NOW_ISO,
+                }
+            ],
+        }
+    ).encode()
+
+
+def test_load_assay_report_empty_results(builder: TraceabilityMatrixBuilder) -> None:
+    stream = io.BytesIO(_EMPTY_RESULTS_JSON)
+
+    report = builder.load_assay_report_stream(stream)
+    assert report.id == "REPORT-EMPTY"
+    assert report.results == []
 
 
-def test_assay_coverage_invalid_negative(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {
-        "id": "REPORT-NEG",
-        "timestamp": "2025-01-01T12:00:00",
-        "results": [
-            {
-                "test_id": "TEST-NEG",
-                "status": "FAIL",
-                "coverage": -0.1,
-                "linked_requirements": [],
-                "timestamp": "2025-01-01T12:00:00",
-            }
-        ],
-    }
-    file_path = tmp_path / "invalid_neg.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
+def test_load_assay_report_complex_links(builder: TraceabilityMatrixBuilder) -> None:
+    stream = io.BytesIO(_COMPLEX_LINKS_JSON)
 
-    with pytest.raises(ValueError, match="Invalid assay report schema"):
-        builder.load_assay_report(file_path)
+    report = builder.load_assay_report_stream(stream)
+    assert len(report.results) == 2
+    assert len(report.results[0].linked_requirements) == 3
+    assert report.results[1].linked_requirements == []
 
 
-def test_assay_coverage_invalid_over_hundred(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {
-        "id": "REPORT-OVER",
-        "timestamp": "2025-01-01T12:00:00",
-        "results": [
-            {
-                "test_id": "TEST-OVER",
-                "status": "PASS",
-                "coverage": 100.1,
-                "linked_requirements": [],
-                "timestamp": "2025-01-01T12:00:00",
-            }
-        ],
-    }
-    file_path = tmp_path / "invalid_over.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
+def test_assay_coverage_boundaries(builder: TraceabilityMatrixBuilder) -> None:
+    stream = io.BytesIO(_BOUNDARIES_JSON)
 
-    with pytest.raises(ValueError, match="Invalid assay report schema"):
-        builder.load_assay_report(file_path)
+    report = builder.load_assay_report_stream(stream)
+    assert report.results[0].coverage == 0.0
+    assert report.results[1].coverage == 100.0
 
 
-def test_assay_invalid_timestamp(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {"id": "REPORT-BAD-TIME", "timestamp": "not-a-timestamp", "results": []}
-    file_path = tmp_path / "bad_time.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(_single_result_json(-0.1), id="coverage-negative"),
+        pytest.param(_single_result_json(100.1), id="coverage-over-hundred"),
+        pytest.param(
+            json.dumps({"id": "REPORT-BAD-TIME", "timestamp": "not-a-timestamp", "results": []}).encode(),
+            id="bad-timestamp",
+        ),
+    ],
+)
+def test_load_assay_report_rejects_invalid(builder: TraceabilityMatrixBuilder, payload: bytes) -> None:
+    stream = io.BytesIO(payload)
 
     with pytest.raises(ValueError, match="Invalid assay report schema"):
-        builder.load_assay_report(file_path)
+        builder.load_assay_report_stream(stream)
@@ -8,30 +8,51 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason-scribe
 
+import io
 import json
+import textwrap
 from pathlib import Path
 
 import pytest
-import yaml
 
 from coreason_scribe.matrix import TraceabilityMatrixBuilder
 from coreason_scribe.models import AssayStatus, RiskLevel
 
-
-@pytest.fixture
-def builder() -> TraceabilityMatrixBuilder:
-    return TraceabilityMatrixBuilder()
+from helpers import NOW_ISO
+
+# Payloads never change between runs, so each is written out once at import.
+_REQUIREMENTS_YAML = textwrap.dedent(
+    """\
+    - id: REQ-001
+      description: Test Req 1
+      risk: HIGH
+      source_sop: SOP-001
+    - id: REQ-002
+      description: Test Req 2
+      risk: LOW
+    """
+).encode()
+
+_REPORT_JSON = json.dumps(
+    {
+        "id": "REPORT-001",
+        "timestamp": NOW_ISO,
+        "results": [
+            {
+                "test_id": "TEST-01",
+                "status": "PASS",
+                "coverage": 100.0,
+                "linked_requirements": ["REQ-001"],
+                "timestamp": NOW_ISO,
+            }
+        ],
+    }
+).encode()
 
 
 def test_load_requirements_success(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    # Create valid agent.yaml
-    data = [
-        {"id": "REQ-001", "description": "Test Req 1", "risk": "HIGH", "source_sop": "SOP-001"},
-        {"id": "REQ-002", "description": "Test Req 2", "risk": "LOW"},
-    ]
     file_path = tmp_path / "agent.yaml"
-    with open(file_path, "w") as f:
-        yaml.dump(data, f)
+    file_path.write_bytes(_REQUIREMENTS_YAML)
 
     reqs = builder.load_requirements(file_path)
     assert len(reqs) == 2
@@ -41,56 +62,9 @@ def test_load_requirements_success(builder: TraceabilityMatrixBuilder, tmp_path:
     assert reqs[1].source_sop is None
 
 
-def test_load_requirements_file_not_found(builder: TraceabilityMatrixBuilder) -> None:
-    with pytest.raises(FileNotFoundError):
-        builder.load_requirements(Path("non_existent.yaml"))
-
-
-def test_load_requirements_invalid_yaml(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    file_path = tmp_path / "invalid.yaml"
-    with open(file_path, "w") as f:
-        f.write("key: value: invalid")
-
-    with pytest.raises(ValueError, match="Failed to parse YAML"):
-        builder.load_requirements(file_path)
-
-
-def test_load_requirements_not_a_list(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    file_path = tmp_path / "dict.yaml"
-    with open(file_path, "w") as f:
-        yaml.dump({"key": "value"}, f)
-
-    with pytest.raises(ValueError, match="Requirements file must contain a list"):
-        builder.load_requirements(file_path)
-
-
-def test_load_requirements_invalid_schema(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = [{"id": "REQ-001"}]  # Missing required fields
-    file_path = tmp_path / "bad_schema.yaml"
-    with open(file_path, "w") as f:
-        yaml.dump(data, f)
-
-    with pytest.raises(ValueError, match="Invalid requirement schema"):
-        builder.load_requirements(file_path)
-
-
 def test_load_assay_report_success(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {
-        "id": "REPORT-001",
-        "timestamp": "2025-01-01T12:00:00",
-        "results": [
-            {
-                "test_id": "TEST-01",
-                "status": "PASS",
-                "coverage": 100.0,
-                "linked_requirements": ["REQ-001"],
-                "timestamp": "2025-01-01T12:00:00",
-            }
-        ],
-    }
     file_path = tmp_path / "assay_report.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
+    file_path.write_bytes(_REPORT_JSON)
 
     report = builder.load_assay_report(file_path)
     assert report.id == "REPORT-001"
@@ -99,25 +73,39 @@ def test_load_assay_report_success(builder: TraceabilityMatrixBuilder, tmp_path:
     assert report.results[0].status == AssayStatus.PASS
 
 
-def test_load_assay_report_file_not_found(builder: TraceabilityMatrixBuilder) -> None:
+@pytest.mark.parametrize(
+    "loader, path",
+    [
+        pytest.param("load_requirements", Path("non_existent.yaml"), id="requirements"),
+        pytest.param("load_assay_report", Path("non_existent.json"), id="assay-report"),
+    ],
+)
+def test_loader_file_not_found(builder: TraceabilityMatrixBuilder, loader: str, path: Path) -> None:
     with pytest.raises(FileNotFoundError):
-        builder.load_assay_report(Path("non_existent.json"))
-
-
-def test_load_assay_report_invalid_json(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    file_path = tmp_path / "invalid.json"
-    with open(file_path, "w") as f:
-        f.write("{invalid json")
-
-    with pytest.raises(ValueError, match="Failed to parse JSON"):
-        builder.load_assay_report(file_path)
-
-
-def test_load_assay_report_invalid_schema(builder: TraceabilityMatrixBuilder, tmp_path: Path) -> None:
-    data = {"id": "REPORT-001"}  # Missing required fields
-    file_path = tmp_path / "bad_schema.json"
-    with open(file_path, "w") as f:
-        json.dump(data, f)
-
-    with pytest.raises(ValueError, match="Invalid assay report schema"):
-        builder.load_assay_report(file_path)
+        getattr(builder, loader)(path)
+
+
+@pytest.mark.parametrize(
+    "payload, match",
+    [
+        pytest.param(b"key: value: invalid", "Failed to parse YAML", id="invalid-yaml"),
+        pytest.param(b"key: value\n", "Requirements file must contain a list", id="not-a-list"),
+        pytest.param(b"- id: REQ-001\n", "Invalid requirement schema", id="missing-fields"),
+        pytest.param(b"- REQ-001\n", "Invalid requirement schema", id="non-mapping-entry"),
+    ],
+)
+def test_load_requirements_rejects_invalid(builder: TraceabilityMatrixBuilder, payload: bytes, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        builder.load_requirements_stream(io.BytesIO(payload))
+
+
+@pytest.mark.parametrize(
+    "payload, match",
+    [
+        pytest.param(b"{invalid json", "Failed to parse JSON", id="invalid-json"),
+        pytest.param(json.dumps({"id": "REPORT-001"}).encode(), "Invalid assay report schema", id="missing-fields"),
+    ],
+)
+def test_load_assay_report_rejects_invalid(builder: TraceabilityMatrixBuilder, payload: bytes, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        builder.load_assay_report_stream(io.BytesIO(payload))